@@ -8,8 +8,16 @@ It includes classes for states, transitions, and the machine itself, and is desi
 
 from typing import List, Optional
 from enum import Enum
+
+import numpy as np
 from tqdm import tqdm
 
+try:
+    from numba import njit, prange
+except ImportError:
+    # Numba is optional: without it the machine runs on the pure-Python loop.
+    njit = None
+
 class TMError(Exception):
     """Base class for exceptions in this module."""
     pass
@@ -24,7 +32,8 @@ class TMDirection(Enum):
 
     def __repr__(self):
         return f"TMDirection.{self.name}"
-    
+
+
 class TMStateType(Enum):
     """Enum for Turing Machine state types."""
     START = 0
@@ -38,9 +47,95 @@ class TMStateType(Enum):
     def __repr__(self):
         return f"TMStateType.{self.name}"
 
+# Plain-int copies of the state types, so the hot loops can compare ints
+# instead of going through Enum equality.
+_ACCEPTING = TMStateType.ACCEPTING.value
+_REJECTING = TMStateType.REJECTING.value
+
+def _run_encoded(next_state, write, delta, buf, lo, hi, head, state, flags, empty_id, max_steps):
+    """
+    Inner loop over the integer-coded machine: states and symbols are ids into
+    the parallel transition arrays (structure-of-arrays layout, so lookups for
+    one (state, symbol) pair sit in contiguous rows), and the tape is a numpy
+    buffer using the cells [lo, hi). Compiled with Numba when it is available.
+
+    Returns a (status, buf, lo, hi, head, state) tuple, where status is 1 for
+    accept, 0 for reject, -1 for a missing transition and -2 if max_steps ran
+    out. The buffer is returned because growing the tape reallocates it.
+    """
+    flag = flags[state]
+    if flag:
+        # flag is 1 for accepting states and 2 for rejecting states,
+        # mapping onto status 1 (accept) and 0 (reject)
+        return 2 - flag, buf, lo, hi, head, state
+
+    for _ in range(max_steps):
+        if head == hi:
+            if hi == buf.shape[0]:
+                grown = np.full(buf.shape[0] * 2, empty_id, dtype=buf.dtype)
+                grown[:buf.shape[0]] = buf
+                buf = grown
+            hi += 1
+
+        symbol = buf[head]
+        target = next_state[state, symbol]
+        if target < 0:
+            return -1, buf, lo, hi, head, state
+
+        buf[head] = write[state, symbol]
+        if delta[state, symbol] > 0:
+            head += 1
+        else:
+            head -= 1
+            if head < lo:
+                if lo == 0:
+                    size = buf.shape[0]
+                    grown = np.full(size * 2, empty_id, dtype=buf.dtype)
+                    grown[size:] = buf
+                    buf = grown
+                    lo += size
+                    hi += size
+                    head += size
+                lo -= 1
+        state = target
+
+        # halting is checked after the step so that a machine reaching an
+        # accepting or rejecting state on its max_steps-th step still halts,
+        # matching the other engines
+        flag = flags[state]
+        if flag:
+            return 2 - flag, buf, lo, hi, head, state
+
+    return -2, buf, lo, hi, head, state
+
+if njit is not None:
+    _run_encoded = njit(_run_encoded)
+
+    @njit(parallel=True)
+    def _run_batch_encoded(next_state, write, delta, tapes, offsets, start, flags, empty_id, max_steps, statuses):
+        """
+        Runs one machine over many independent tapes in parallel. The tapes are
+        packed into one flat array CSR-style (tape i is tapes[offsets[i]:
+        offsets[i + 1]]); each prange iteration copies its slice into a private
+        buffer and runs the single-tape kernel, writing the status into
+        statuses[i].
+        """
+        for i in prange(offsets.shape[0] - 1):
+            begin = offsets[i]
+            size = offsets[i + 1] - begin
+            buf = np.full(max(size, 1), empty_id, dtype=np.int64)
+            buf[:size] = tapes[begin:begin + size]
+            status, buf, lo, hi, head, state = _run_encoded(
+                next_state, write, delta, buf, 0, size, 0, start, flags,
+                empty_id, max_steps)
+            statuses[i] = status
+
 class TMState:
     """Class representing a state in a Turing Machine."""
 
+    __slots__ = ('name', 'state_type', 'state_type_int', 'halt_flags', 'transitions',
+                 'transitions_by_symbol', 'transitions_by_byte', 'scan_skip')
+
     def __init__(self, name : str, state_type: TMStateType = TMStateType.NORMAL):
         """
         Initializes a Turing Machine state.
@@ -49,7 +144,13 @@ class TMState:
         """
         self.name = name
         self.state_type = state_type
+        self.state_type_int = state_type.value
+        # non-zero only for halting states, so one truth test covers both
+        self.halt_flags = self.state_type_int if self.state_type_int in (_ACCEPTING, _REJECTING) else 0
         self.transitions = []
+        self.transitions_by_symbol = {}
+        self.transitions_by_byte = {}
+        self.scan_skip = None
 
     def add_transition(self, symbol, new_state, new_symbol, direction):
         """
@@ -59,9 +160,14 @@ class TMState:
         :param new_symbol: Symbol to write on the tape.
         :param direction: Direction to move the tape head (LEFT or RIGHT).
         :return: self for method chaining.
+        :raises TMError: If a transition for the symbol already exists, as this would make the machine non-deterministic.
         """
+        if symbol in self.transitions_by_symbol:
+            raise TMError(f"Invalid: Duplicate transition for symbol '{symbol}' in state '{self.name}'. Please ensure deterministic TMs are used.")
+
         transition = TMTransition(self, symbol, new_state, new_symbol, direction)
         self.transitions.append(transition)
+        self.transitions_by_symbol[symbol] = transition
         return self
 
     def __str__(self):
@@ -72,6 +178,9 @@ class TMState:
 class TMTransition:
     """Class representing a transition in a Turing Machine."""
 
+    __slots__ = ('state', 'symbol', 'new_state', 'new_symbol', 'direction',
+                 'delta', 'pure_move', 'target_state', 'new_symbol_byte')
+
     def __init__(self, state: TMState, symbol: str, new_state: str, new_symbol: str, direction: TMDirection):
         """
         Initializes a Turing Machine transition.
@@ -86,24 +195,60 @@ class TMTransition:
         self.new_state = new_state
         self.new_symbol = new_symbol
         self.direction = direction
+        self.delta = direction.value
+        self.pure_move = new_symbol == symbol
+        self.target_state = None
+        self.new_symbol_byte = None
 
 class TM:
     """Class representing a Turing Machine."""
 
+    __slots__ = ('empty_symbol', 'states', 'implicit_reject', 'current_state',
+                 'accepting_states', 'rejecting_states', '_state_by_name', '_start_state',
+                 '_symbol_ids', '_symbols', '_empty_byte', '_buf', '_lo', '_hi',
+                 '_head', '_state_ids', '_state_flags', '_next_state', '_write',
+                 '_delta', '_compiled_run')
+
     def __init__(self, states : List[TMState], tape: List[str] = [], empty_symbol: Optional[str] = '_', implicit_reject: bool = False):
         """
         Initializes a Turing Machine.
         :param states: List of TMState objects defining the machine's states.
         :param tape: Initial tape content as a list of symbols.
         :param empty_symbol: Symbol representing an empty cell on the tape.
-        :param implicit_reject: If True, the machine will implicitly reject if it reaches a state without transitions.
+        :param implicit_reject: If True, the machine will implicitly reject if no transition matches the current state and symbol, instead of raising TMError.
         """
         self.empty_symbol = empty_symbol
-        self.tape = tape
         self.states = states
         self.implicit_reject = implicit_reject
-        self.head_pos = 0
-        
+        # The tape is one bytearray of symbol ids with amortized O(1) growth in
+        # both directions: the used cells are _buf[_lo:_hi], _head is an
+        # absolute index into _buf, and running out of room on either side
+        # doubles the buffer. Cells outside the used region always hold the
+        # empty symbol, so extending is just moving a bound. The tape and
+        # head_pos properties present the usual flat, decoded view.
+        self._symbol_ids = {}
+        self._symbols = []
+        self._empty_byte = self._intern(empty_symbol)
+        encoded = bytearray(self._intern(symbol) for symbol in tape)
+        self._buf = encoded if encoded else bytearray([self._empty_byte])
+        self._lo = 0
+        self._hi = len(encoded)
+        self._head = 0
+
+        self._state_by_name = {}
+        for state in states:
+            if state.name in self._state_by_name:
+                raise TMError(f"Invalid: Duplicate state name '{state.name}'. Please ensure state names are unique.")
+            self._state_by_name[state.name] = state
+
+        # resolve transition targets to state objects once, so step doesn't have to
+        for state in states:
+            for transition in state.transitions:
+                target = self._state_by_name.get(transition.new_state)
+                if target is None:
+                    raise TMError("Invalid: Transition to a non-existent state. Please ensure deterministic TMs are used.")
+                transition.target_state = target
+
         start = [s for s in states if s.state_type == TMStateType.START]
         if len(start) != 1:
             raise TMError("There must be exactly one start state.")
@@ -111,6 +256,7 @@ class TM:
             raise TMError("There must be a start state.")
         
         self.current_state = start[0]
+        self._start_state = start[0]
 
         self.accepting_states = [s for s in states if s.state_type == TMStateType.ACCEPTING]
         self.rejecting_states = [s for s in states if s.state_type == TMStateType.REJECTING]
@@ -119,7 +265,188 @@ class TM:
             raise TMError("There must be at least one accepting state.")
         if not self.implicit_reject and len(self.rejecting_states) == 0:
             raise TMError("There must be at least one rejecting state.")
-        
+
+        self._build_tables()
+
+    def _intern(self, symbol):
+        """
+        Returns the byte id for a tape symbol, assigning a new id if the symbol
+        hasn't been seen before.
+        :raises TMError: If the tape alphabet would exceed 256 symbols.
+        """
+        symbol_id = self._symbol_ids.get(symbol)
+        if symbol_id is None:
+            if len(self._symbols) == 256:
+                raise TMError("Invalid: The tape alphabet cannot exceed 256 symbols.")
+            symbol_id = len(self._symbols)
+            self._symbol_ids[symbol] = symbol_id
+            self._symbols.append(symbol)
+        return symbol_id
+
+    def _build_tables(self):
+        """
+        Integer-codes the states and the tape alphabet and lays the transition
+        function out as parallel numpy arrays (structure-of-arrays): target
+        state, written symbol and head delta each live in their own dense
+        (state, symbol) table, with -1 in _next_state marking a missing
+        transition. Also gives each state a byte-keyed transition dict and each
+        transition its written symbol's byte id, so the Python-level loops work
+        on tape bytes directly.
+        """
+        for state in self.states:
+            for transition in state.transitions:
+                self._intern(transition.symbol)
+                transition.new_symbol_byte = self._intern(transition.new_symbol)
+
+        self._state_ids = {state.name: i for i, state in enumerate(self.states)}
+        self._state_flags = np.array([s.halt_flags for s in self.states], dtype=np.uint8)
+
+        symbol_ids = self._symbol_ids
+        shape = (len(self.states), len(self._symbols))
+        self._next_state = np.full(shape, -1, dtype=np.int32)
+        self._write = np.zeros(shape, dtype=np.int32)
+        self._delta = np.zeros(shape, dtype=np.int8)
+        for i, state in enumerate(self.states):
+            state.transitions_by_byte = {symbol_ids[t.symbol]: t for t in state.transitions}
+            # a pure-move self-loop means the state just scans over that
+            # symbol; record it so _run_fast can skip the whole run at once
+            state.scan_skip = None
+            for transition in state.transitions:
+                if transition.pure_move and transition.target_state is state:
+                    state.scan_skip = (symbol_ids[transition.symbol], transition.delta)
+                    break
+            for transition in state.transitions:
+                symbol_id = symbol_ids[transition.symbol]
+                self._next_state[i, symbol_id] = self._state_ids[transition.new_state]
+                self._write[i, symbol_id] = transition.new_symbol_byte
+                self._delta[i, symbol_id] = transition.delta
+
+        self._compiled_run = self._compile_run()
+
+    def _compile_run(self):
+        """
+        Builds a run loop specialized to this machine with exec: the transition
+        function is emitted as if/elif chains over the integer state and symbol
+        ids, so the generated loop steps without any dict lookups or attribute
+        loads - the code is the table. Transitions into halting states return
+        directly, matching the halt-on-entry behaviour of the other loops.
+        Returns a function with the same contract as the compiled kernel.
+        """
+        accept_ids = tuple(self._state_ids[s.name] for s in self.accepting_states)
+        reject_ids = tuple(self._state_ids[s.name] for s in self.rejecting_states)
+        halting = set(accept_ids) | set(reject_ids)
+
+        lines = ["def _tm_run(buf, lo, hi, head, state, max_steps, empty):"]
+        if accept_ids:
+            lines.append(f"    if state in {accept_ids!r}: return 1, buf, lo, hi, head, state")
+        if reject_ids:
+            lines.append(f"    if state in {reject_ids!r}: return 0, buf, lo, hi, head, state")
+        lines.append("    for _ in range(max_steps):")
+        lines.append("        if head == hi:")
+        lines.append("            if hi == len(buf):")
+        lines.append("                grown = bytearray(bytes((empty,)) * (len(buf) * 2))")
+        lines.append("                grown[:len(buf)] = buf")
+        lines.append("                buf = grown")
+        lines.append("            hi += 1")
+        lines.append("        symbol = buf[head]")
+
+        first_state = True
+        for i, state in enumerate(self.states):
+            if i in halting or not state.transitions:
+                continue
+            keyword = "if" if first_state else "elif"
+            first_state = False
+            lines.append(f"        {keyword} state == {i}:")
+            first_symbol = True
+            for transition in state.transitions:
+                keyword = "if" if first_symbol else "elif"
+                first_symbol = False
+                lines.append(f"            {keyword} symbol == {self._symbol_ids[transition.symbol]}:")
+                self._emit_transition(lines, "                ", transition)
+            lines.append("            else:")
+            lines.append("                return -1, buf, lo, hi, head, state")
+        if first_state:
+            lines.append("        return -1, buf, lo, hi, head, state")
+        else:
+            lines.append("        else:")
+            lines.append("            return -1, buf, lo, hi, head, state")
+        lines.append("    return -2, buf, lo, hi, head, state")
+
+        namespace = {}
+        exec(compile("\n".join(lines), "<TM codegen>", "exec"), namespace)
+        return namespace["_tm_run"]
+
+    def _emit_transition(self, lines, pad, transition):
+        """Emits the straight-line body for one transition into _compile_run's source."""
+        target_id = self._state_ids[transition.new_state]
+        if not transition.pure_move:
+            lines.append(f"{pad}buf[head] = {transition.new_symbol_byte}")
+        if transition.delta > 0:
+            lines.append(f"{pad}head += 1")
+        else:
+            lines.append(f"{pad}head -= 1")
+            lines.append(f"{pad}if head < lo:")
+            lines.append(f"{pad}    if lo == 0:")
+            lines.append(f"{pad}        size = len(buf)")
+            lines.append(f"{pad}        grown = bytearray(bytes((empty,)) * (size * 2))")
+            lines.append(f"{pad}        grown[size:] = buf")
+            lines.append(f"{pad}        buf = grown")
+            lines.append(f"{pad}        lo += size")
+            lines.append(f"{pad}        hi += size")
+            lines.append(f"{pad}        head += size")
+            lines.append(f"{pad}    lo -= 1")
+        kind = transition.target_state.state_type_int
+        if kind == _ACCEPTING:
+            lines.append(f"{pad}return 1, buf, lo, hi, head, {target_id}")
+        elif kind == _REJECTING:
+            lines.append(f"{pad}return 0, buf, lo, hi, head, {target_id}")
+        else:
+            lines.append(f"{pad}state = {target_id}")
+
+    @property
+    def tape(self):
+        """Current tape contents as a flat list of symbols, leftmost cell first."""
+        symbols = self._symbols
+        return [symbols[cell] for cell in self._buf[self._lo:self._hi]]
+
+    @tape.setter
+    def tape(self, value):
+        head_pos = self.head_pos
+        encoded = bytearray(self._intern(symbol) for symbol in value)
+        self._buf = encoded if encoded else bytearray([self._empty_byte])
+        self._lo = 0
+        self._hi = len(encoded)
+        self._head = head_pos
+        # new symbols widen the alphabet, which means the tables need rebuilding
+        if len(self._symbols) != self._next_state.shape[1]:
+            self._build_tables()
+
+    @property
+    def head_pos(self):
+        """Current position of the tape head, indexed into the flat tape view."""
+        return self._head - self._lo
+
+    @head_pos.setter
+    def head_pos(self, value):
+        self._head = self._lo + value
+
+    def _grow_left(self):
+        """Doubles the tape buffer, shifting the used region into the top half."""
+        size = len(self._buf)
+        grown = bytearray(bytes([self._empty_byte]) * (size * 2))
+        grown[size:] = self._buf
+        self._buf = grown
+        self._lo += size
+        self._hi += size
+        self._head += size
+
+    def _grow_right(self):
+        """Doubles the tape buffer, keeping the used region in the bottom half."""
+        size = len(self._buf)
+        grown = bytearray(bytes([self._empty_byte]) * (size * 2))
+        grown[:size] = self._buf
+        self._buf = grown
+
     def run(self, max_steps=1000, verbose=False, show_progress=False):
         """
         Runs the Turing Machine for a specified number of steps or until it reaches an accepting or rejecting state.
@@ -129,22 +456,292 @@ class TM:
         :return: True if the machine accepts the input, False if it rejects.
         """
 
+        # a machine that can't take a single step shouldn't pay for engine
+        # dispatch or progress-bar setup
+        if self.current_state is not None:
+            flags = self.current_state.halt_flags
+            if flags:
+                return flags == _ACCEPTING
+            if self.implicit_reject and not self.current_state.transitions_by_byte:
+                # leave the machine in the same halted-without-transition
+                # configuration the engines produce, including the
+                # extension-on-read of the cell the dead state was looking at
+                if self._head == self._hi:
+                    if self._hi == len(self._buf):
+                        self._grow_right()
+                    self._hi += 1
+                self.current_state = None
+                return False
+
+        if not verbose:
+            if show_progress:
+                return self._run_progress(max_steps)
+            if njit is not None:
+                return self._run_compiled(max_steps)
+            return self._run_specialized(max_steps)
+
+        if self.current_state is None:
+            # halted in an earlier run with no matching transition under
+            # implicit_reject, so there is no configuration left to print
+            return False
+
         iterable = tqdm(range(max_steps), desc=f"Running Turing Machine for at most {max_steps}") if show_progress else range(max_steps)
         for _ in iterable:
-            if verbose:
-                print(self._config_repr())
+            print(self._config_repr())
+
+            self.step()
 
-            if not self.implicit_reject and self.current_state is None:
-                raise TMError("Invalid: Cannot Perform Process Tape input due to missing transitions. Please ensure deterministic TMs are used.")
-            elif self.current_state is None:
+            if self.current_state is None:
                 return False
 
-            if self.current_state.state_type == TMStateType.ACCEPTING:
-                return True
-            if self.current_state.state_type == TMStateType.REJECTING:
+            # halting is checked after the step so that a machine reaching an
+            # accepting or rejecting state on its max_steps-th step still
+            # halts, matching the other engines
+            flags = self.current_state.halt_flags
+            if flags:
+                print(self._config_repr())
+                return flags == _ACCEPTING
+
+    def _run_progress(self, max_steps, chunk=1024):
+        """
+        Runs the machine with a progress bar updated once per chunk of steps
+        rather than once per step, so the inner loop never touches the bar.
+        The chunks run on the in-place fast loop to avoid re-encoding the tape
+        between updates.
+        :param max_steps: Maximum number of steps to run the machine.
+        :param chunk: Number of steps per progress-bar update.
+        :return: True if the machine accepts the input, False if it rejects.
+        """
+        pbar = tqdm(total=max_steps, desc=f"Running Turing Machine for at most {max_steps}")
+        try:
+            done = 0
+            while done < max_steps:
+                budget = min(chunk, max_steps - done)
+                result = self._run_fast(budget)
+                done += budget
+                pbar.update(budget)
+                if result is not None:
+                    return result
+        finally:
+            pbar.close()
+
+    def run_batch(self, tapes, max_steps=1000):
+        """
+        Runs the machine over a batch of independent tapes, each starting from
+        the start state. The machine's own tape, head and current state are
+        left untouched. With Numba available the tapes are packed into one flat
+        array and classified in parallel across cores; otherwise they run one
+        after another on the generated loop.
+        :param tapes: Iterable of tapes, each a list of symbols.
+        :param max_steps: Maximum number of steps to run on each tape.
+        :return: List with one entry per tape: True if accepted, False if rejected, None if max_steps ran out.
+        :raises TMError: If a tape hits a missing transition and implicit_reject is not set.
+        """
+        encoded_tapes = [bytearray(self._intern(symbol) for symbol in tape) for tape in tapes]
+        # new symbols widen the alphabet, which means the tables need rebuilding
+        if len(self._symbols) != self._next_state.shape[1]:
+            self._build_tables()
+
+        start_id = self._state_ids[self._start_state.name]
+        empty = self._empty_byte
+
+        if njit is not None:
+            offsets = np.zeros(len(encoded_tapes) + 1, dtype=np.int64)
+            for i, encoded in enumerate(encoded_tapes):
+                offsets[i + 1] = offsets[i] + len(encoded)
+            flat = np.zeros(int(offsets[-1]), dtype=np.int64)
+            for i, encoded in enumerate(encoded_tapes):
+                flat[offsets[i]:offsets[i + 1]] = np.frombuffer(bytes(encoded), dtype=np.uint8)
+            statuses = np.empty(len(encoded_tapes), dtype=np.int64)
+            _run_batch_encoded(self._next_state, self._write, self._delta, flat,
+                               offsets, start_id, self._state_flags, empty,
+                               max_steps, statuses)
+        else:
+            statuses = []
+            for encoded in encoded_tapes:
+                buf = bytearray(encoded) if encoded else bytearray([empty])
+                statuses.append(self._compiled_run(
+                    buf, 0, len(encoded), 0, start_id, max_steps, empty)[0])
+
+        results = []
+        for status in statuses:
+            if status == 1:
+                results.append(True)
+            elif status == 0:
+                results.append(False)
+            elif status == -1:
+                if self.implicit_reject:
+                    results.append(False)
+                else:
+                    raise TMError("Invalid: No possible transition was found. Please ensure deterministic TMs are used.")
+            else:
+                results.append(None)
+        return results
+
+    def _run_compiled(self, max_steps):
+        """
+        Runs the machine on the integer-coded transition table via the compiled
+        kernel, then maps the result back onto the byte-coded tape and the
+        current state.
+        :param max_steps: Maximum number of steps to run the machine.
+        :return: True if the machine accepts the input, False if it rejects.
+        """
+        if self.current_state is None:
+            return self._run_fast(max_steps)
+
+        buf = np.frombuffer(bytes(self._buf), dtype=np.uint8).astype(np.int64)
+
+        status, buf, lo, hi, head, state_id = _run_encoded(
+            self._next_state, self._write, self._delta, buf, self._lo, self._hi,
+            self._head, self._state_ids[self.current_state.name],
+            self._state_flags, self._empty_byte, max_steps)
+
+        self._buf = bytearray(buf.astype(np.uint8).tobytes())
+        self._lo = lo
+        self._hi = hi
+        self._head = head
+        return self._apply_run_result(status, state_id)
+
+    def _run_specialized(self, max_steps):
+        """
+        Runs the machine on the exec-generated loop from _compile_run, then
+        maps the result back onto the current state.
+        :param max_steps: Maximum number of steps to run the machine.
+        :return: True if the machine accepts the input, False if it rejects.
+        """
+        if self.current_state is None:
+            return self._run_fast(max_steps)
+
+        status, self._buf, self._lo, self._hi, self._head, state_id = self._compiled_run(
+            self._buf, self._lo, self._hi, self._head,
+            self._state_ids[self.current_state.name], max_steps, self._empty_byte)
+        return self._apply_run_result(status, state_id)
+
+    def _apply_run_result(self, status, state_id):
+        """Translates a kernel-style (status, state id) result into run()'s return value."""
+        self.current_state = self.states[state_id]
+        if status == 1:
+            return True
+        if status == 0:
+            return False
+        if status == -1:
+            if self.implicit_reject:
+                # matches step: halting without a matching transition rejects
+                self.current_state = None
                 return False
-            
-            self.step()
+            raise TMError("Invalid: No possible transition was found. Please ensure deterministic TMs are used.")
+
+    def _run_fast(self, max_steps):
+        """
+        Specialized inner loop for run() when no per-step output is requested.
+        Inlines step() and keeps the hot values in locals, so each cycle avoids
+        the attribute lookups and dead verbose/progress branches of the general
+        loop. The machine state is written back before returning so step() and
+        the tape/head_pos properties stay consistent.
+        :param max_steps: Maximum number of steps to run the machine.
+        :return: True if the machine accepts the input, False if it rejects.
+        """
+        buf = self._buf
+        lo = self._lo
+        hi = self._hi
+        head = self._head
+        state = self.current_state
+        empty = self._empty_byte
+        implicit_reject = self.implicit_reject
+
+        if state is None:
+            # previously halted with no matching transition
+            return False
+
+        # the table and its bound .get are rebound whenever the state changes,
+        # so the lookup in the loop body is a plain local call
+        table = state.transitions_by_byte
+        lookup = table.get
+
+        try:
+            # check the entry state once, then halt-check straight after each
+            # step so a run never spends an extra iteration on a halted machine
+            flags = state.halt_flags
+            if flags:
+                return flags == _ACCEPTING
+
+            steps = 0
+            while steps < max_steps:
+                if head == hi:
+                    if hi == len(buf):
+                        grown = bytearray(bytes([empty]) * (len(buf) * 2))
+                        grown[:len(buf)] = buf
+                        buf = grown
+                    hi += 1
+
+                symbol = buf[head]
+
+                scan = state.scan_skip
+                if scan is not None and symbol == scan[0]:
+                    # the state self-loops over this symbol: jump the head over
+                    # the whole run of it in one vectorized compare instead of
+                    # one loop iteration per cell, charging a step per cell
+                    scan_byte, scan_delta = scan
+                    cells = np.frombuffer(buf, dtype=np.uint8)
+                    remaining = max_steps - steps
+                    if scan_delta > 0:
+                        segment = cells[head:min(hi, head + remaining)]
+                        mismatch = segment != scan_byte
+                        moved = int(mismatch.argmax()) if mismatch.any() else segment.shape[0]
+                        head += moved
+                    else:
+                        segment = cells[max(lo, head - remaining + 1):head + 1]
+                        mismatch = (segment != scan_byte)[::-1]
+                        moved = int(mismatch.argmax()) if mismatch.any() else segment.shape[0]
+                        head -= moved
+                        if head < lo:
+                            if lo == 0:
+                                size = len(buf)
+                                grown = bytearray(bytes([empty]) * (size * 2))
+                                grown[size:] = buf
+                                buf = grown
+                                lo += size
+                                hi += size
+                                head += size
+                            lo -= 1
+                    steps += moved
+                    continue
+
+                transition = lookup(symbol)
+                if transition is None:
+                    if implicit_reject:
+                        state = None
+                        return False
+                    raise TMError("Invalid: No possible transition was found. Please ensure deterministic TMs are used.")
+
+                steps += 1
+                if not transition.pure_move:
+                    buf[head] = transition.new_symbol_byte
+                state = transition.target_state
+                head += transition.delta
+                if head < lo:
+                    if lo == 0:
+                        size = len(buf)
+                        grown = bytearray(bytes([empty]) * (size * 2))
+                        grown[size:] = buf
+                        buf = grown
+                        lo += size
+                        hi += size
+                        head += size
+                    lo -= 1
+
+                flags = state.halt_flags
+                if flags:
+                    return flags == _ACCEPTING
+
+                table = state.transitions_by_byte
+                lookup = table.get
+        finally:
+            self._buf = buf
+            self._lo = lo
+            self._hi = hi
+            self._head = head
+            self.current_state = state
 
     def step(self):
         """
@@ -155,32 +752,31 @@ class TM:
         Note that in this implementation, the tape is extended with the empty symbol if the head position exceeds the current tape length,
         and if the head moves left from the first position, a new empty symbol is added at the start of the tape.
 
-        :raises TMError: If no valid transition is found or if the transition leads to a non-existent state.
+        :raises TMError: If no valid transition is found and implicit_reject is not set.
         """
 
-        # add empty symbol to tape if there's nothing there
-        if self.head_pos >= len(self.tape): self.tape.append(self.empty_symbol)
-        
-        transitions = [t for t in self.current_state.transitions if t.symbol == self.tape[self.head_pos]] 
-        if len(transitions) != 1:
-            raise TMError("Invalid: No possible transition was found. Please ensure deterministic TMs are used.")
-        
-        self.tape[self.head_pos] = transitions[0].new_symbol
+        # extend the used region if the head sits just past its right edge
+        if self._head == self._hi:
+            if self._hi == len(self._buf):
+                self._grow_right()
+            self._hi += 1
 
-        new_states = [s for s in self.states if s.name == transitions[0].new_state]
-        if len(new_states) != 1:
-            raise TMError("Invalid: Transition to a non-existent state. Please ensure deterministic TMs are used.")
+        transition = self.current_state.transitions_by_byte.get(self._buf[self._head])
+        if transition is None:
+            if self.implicit_reject:
+                # halted without a matching transition: run() reports rejection
+                self.current_state = None
+                return
+            raise TMError("Invalid: No possible transition was found. Please ensure deterministic TMs are used.")
 
-        self.current_state = new_states[0]
+        self._buf[self._head] = transition.new_symbol_byte
+        self.current_state = transition.target_state
 
-        if self.head_pos == 0 and transitions[0].direction == TMDirection.LEFT:
-            self.tape.insert(0, self.empty_symbol)
-            return
-        if transitions[0].direction == TMDirection.LEFT:
-            self.head_pos -= 1
-            return
-        
-        self.head_pos += 1
+        self._head += transition.delta
+        if self._head < self._lo:
+            if self._lo == 0:
+                self._grow_left()
+            self._lo -= 1
 
     def _config_repr(self):
         return f"Tape: {self.tape}, Head Position: {self.head_pos}, Current State: {self.current_state.name}"
\ No newline at end of file
@@ -22,6 +22,7 @@ def test_state_str_repr_and_add_transition():
     returned = s.add_transition('x', 'B', 'y', TMDirection.RIGHT)
     assert returned is s
     assert s.transitions and isinstance(s.transitions[0], TMTransition)
+    assert s.transitions_by_symbol['x'] is s.transitions[0]
 
 def test_transition_properties():
     s = TMState('X', TMStateType.START)
@@ -41,6 +42,13 @@ def test_init_errors_missing_states():
     with pytest.raises(TMError, match="at least one accepting state"): TM([start, rejecting], [])
     with pytest.raises(TMError, match="at least one rejecting state"): TM([start, accepting], [])
 
+def test_duplicate_state_names_error():
+    start = TMState('S', TMStateType.START)
+    duplicate = TMState('S', TMStateType.NORMAL)
+    accepting = TMState('A', TMStateType.ACCEPTING)
+    rejecting = TMState('R', TMStateType.REJECTING)
+    with pytest.raises(TMError, match="Duplicate state name"): TM([start, duplicate, accepting, rejecting], [])
+
 def test_config_repr():
     start = TMState('S', TMStateType.START)
     acc = TMState('A', TMStateType.ACCEPTING)
@@ -61,6 +69,85 @@ def test_run_accept_and_reject():
     m2 = TM([start2, acc, rej], [], empty_symbol='_')
     assert m2.run() is False
 
+def _four_step_acceptor():
+    states = [TMState('S0', TMStateType.START), TMState('S1'), TMState('S2'), TMState('S3'),
+              TMState('A', TMStateType.ACCEPTING), TMState('R', TMStateType.REJECTING)]
+    states[0].add_transition('_', 'S1', '_', TMDirection.RIGHT)
+    states[1].add_transition('_', 'S2', '_', TMDirection.RIGHT)
+    states[2].add_transition('_', 'S3', '_', TMDirection.RIGHT)
+    states[3].add_transition('_', 'A', '_', TMDirection.RIGHT)
+    return TM(states, [], empty_symbol='_')
+
+def test_halt_on_final_step_counts_for_every_engine(capsys):
+    # accepting on exactly the max_steps-th step must halt the same way no
+    # matter which engine run() dispatches to
+    assert _four_step_acceptor().run(max_steps=4) is True
+    assert _four_step_acceptor().run(max_steps=4, verbose=True) is True
+    assert _four_step_acceptor().run(max_steps=4, show_progress=True) is True
+    assert _four_step_acceptor().run(max_steps=3) is None
+    capsys.readouterr()
+
+def test_implicit_reject_on_state_without_transitions():
+    s = TMState('S', TMStateType.START)
+    dead = TMState('D')
+    a = TMState('A', TMStateType.ACCEPTING)
+    s.add_transition('_', 'D', '_', TMDirection.RIGHT)
+    m = TM([s, dead, a], [], empty_symbol='_', implicit_reject=True)
+    assert m.run() is False
+    assert m.current_state is None
+
+def _dead_state_machine():
+    s = TMState('S', TMStateType.START)
+    dead = TMState('D')
+    a = TMState('A', TMStateType.ACCEPTING)
+    s.add_transition('a', 'D', 'a', TMDirection.RIGHT)
+    return TM([s, dead, a], ['a'], empty_symbol='_', implicit_reject=True)
+
+def test_implicit_reject_halted_configuration_matches_across_engines(capsys):
+    machines = [_dead_state_machine() for _ in range(3)]
+    assert machines[0].run() is False
+    assert machines[1].run(show_progress=True) is False
+    assert machines[2].run(verbose=True) is False
+    # every engine halts in the identical configuration, including the
+    # extension-on-read of the cell the dead state was looking at
+    configs = [(m.tape, m.head_pos, m.current_state) for m in machines]
+    assert configs[0] == configs[1] == configs[2]
+    assert machines[0].tape == ['a', '_']
+    capsys.readouterr()
+
+def test_resumed_run_matches_single_run_configuration():
+    # pausing in the dead state and resuming must leave the same halted
+    # configuration as running straight through
+    resumed = _dead_state_machine()
+    assert resumed.run(max_steps=1) is None
+    assert resumed.run(max_steps=1) is False
+    single = _dead_state_machine()
+    assert single.run(max_steps=2) is False
+    assert (resumed.tape, resumed.head_pos, resumed.current_state) == \
+           (single.tape, single.head_pos, single.current_state)
+
+def test_implicit_reject_on_start_state_without_transitions():
+    s = TMState('S', TMStateType.START)
+    a = TMState('A', TMStateType.ACCEPTING)
+    m = TM([s, a], [], empty_symbol='_', implicit_reject=True)
+    assert m.run() is False
+    assert m.current_state is None
+
+def test_implicit_reject_on_missing_transition():
+    s = TMState('S', TMStateType.START)
+    a = TMState('A', TMStateType.ACCEPTING)
+    s.add_transition('a', 'A', 'a', TMDirection.RIGHT)
+    m = TM([s, a], ['b'], empty_symbol='_', implicit_reject=True)
+    assert m.run() is False
+
+def test_implicit_reject_with_verbose_output(capsys):
+    s = TMState('S', TMStateType.START)
+    a = TMState('A', TMStateType.ACCEPTING)
+    s.add_transition('a', 'A', 'a', TMDirection.RIGHT)
+    m = TM([s, a], ['b'], empty_symbol='_', implicit_reject=True)
+    assert m.run(verbose=True) is False
+    capsys.readouterr()
+
 def test_no_transitions_raises_error():
     start = TMState('S', TMStateType.START)
     accepting = TMState('A', TMStateType.ACCEPTING)
@@ -70,20 +157,76 @@ def test_no_transitions_raises_error():
 
 def test_multiple_transitions_error():
     s = TMState('S', TMStateType.START)
-    a = TMState('A', TMStateType.ACCEPTING)
-    r = TMState('R', TMStateType.REJECTING)
     s.add_transition('_', 'A', '_', TMDirection.RIGHT)
-    s.add_transition('_', 'R', '_', TMDirection.RIGHT)
-    m = TM([s, a, r], [], empty_symbol='_')
-    with pytest.raises(TMError, match="No possible transition"): m.step()
+    with pytest.raises(TMError, match="Duplicate transition"): s.add_transition('_', 'R', '_', TMDirection.RIGHT)
 
 def test_transition_to_nonexistent_state_error():
     s = TMState('S', TMStateType.START)
     a = TMState('A', TMStateType.ACCEPTING)
     r = TMState('R', TMStateType.REJECTING)
     s.add_transition('_', 'X', '_', TMDirection.RIGHT)
-    m = TM([s, a, r], [], empty_symbol='_')
-    with pytest.raises(TMError, match="non-existent state"): m.step()
+    with pytest.raises(TMError, match="non-existent state"): TM([s, a, r], [], empty_symbol='_')
+
+def test_run_batch():
+    states = [
+        TMState('start', TMStateType.START)
+            .add_transition('a', 'one_a', 'a', TMDirection.RIGHT),
+        TMState('one_a')
+            .add_transition('b', 'one_b', 'b', TMDirection.RIGHT),
+        TMState('one_b')
+            .add_transition('a', 'one_b', 'a', TMDirection.RIGHT)
+            .add_transition('_', 'accept', '_', TMDirection.RIGHT),
+        TMState('accept', TMStateType.ACCEPTING)
+    ]
+    m = TM(states, tape=['a', 'b', 'a'], implicit_reject=True)
+    results = m.run_batch([['a', 'b', 'a'], ['b'], ['a', 'b'], [], ['a', 'b', 'a', 'a']])
+    assert results == [True, False, True, False, True]
+    # the machine's own configuration is untouched
+    assert m.tape == ['a', 'b', 'a']
+    assert m.head_pos == 0
+    assert m.current_state.name == 'start'
+
+def _right_scanner(tape):
+    s = TMState('S', TMStateType.START)
+    s.add_transition('a', 'S', 'a', TMDirection.RIGHT)
+    s.add_transition('_', 'A', '_', TMDirection.RIGHT)
+    a = TMState('A', TMStateType.ACCEPTING)
+    return TM([s, a], tape, empty_symbol='_', implicit_reject=True)
+
+def test_scan_skip_right():
+    m = _right_scanner(['a'] * 50)
+    assert m._run_fast(1000) is True
+    assert m.head_pos == 51
+    assert m.tape == ['a'] * 50 + ['_']
+
+def test_scan_skip_left_grows_tape():
+    s = TMState('S', TMStateType.START)
+    s.add_transition('a', 'S', 'a', TMDirection.LEFT)
+    s.add_transition('_', 'A', '_', TMDirection.RIGHT)
+    a = TMState('A', TMStateType.ACCEPTING)
+    m = TM([s, a], ['a'] * 40, empty_symbol='_', implicit_reject=True)
+    m.head_pos = 39
+    assert m._run_fast(1000) is True
+    # the scan ran off the left edge, inserting an empty cell
+    assert m.tape == ['_'] + ['a'] * 40
+    assert m.head_pos == 1
+
+def test_scan_skip_respects_step_budget():
+    m = _right_scanner(['a'] * 100)
+    assert m._run_fast(30) is None
+    assert m.head_pos == 30
+    assert m.current_state.name == 'S'
+
+def test_run_progress_spans_chunks(capsys):
+    # 3000 steps of scanning crosses several 1024-step progress chunks
+    m = _right_scanner(['a'] * 3000)
+    assert m.run(max_steps=10000, show_progress=True) is True
+    assert m.head_pos == 3001
+    # a budget smaller than the tape exhausts without a verdict
+    m2 = _right_scanner(['a'] * 3000)
+    assert m2.run(max_steps=100, show_progress=True) is None
+    assert m2.head_pos == 100
+    capsys.readouterr()
 
 def test_tape_extension_and_right_movement():
     s = TMState('S', TMStateType.START)